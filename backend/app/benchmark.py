@@ -0,0 +1,69 @@
+# benchmark.py
+#
+# Load generator for the generation routes. Run the backend with
+# LLM_PROVIDER=fake to benchmark offline without calling the OpenAI API:
+#
+#   LLM_PROVIDER=fake python app.py
+#   python benchmark.py --route /generate-search-string --requests 500 --concurrency 50
+
+import argparse
+import concurrent.futures
+import statistics
+import time
+
+import requests
+
+QUESTION = "Does isotretinoin increase the risk of depression in adolescents with acne?"
+
+def run_request(session, url, payload):
+    start = time.perf_counter()
+    try:
+        response = session.post(url, json=payload, timeout=300)
+        ok = response.status_code == 200
+    except requests.exceptions.RequestException as e:
+        print(f"Request failed: {str(e)}")
+        ok = False
+    return ok, time.perf_counter() - start
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the literature review backend")
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--route", default="/generate-search-string")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--unique", action="store_true",
+                        help="Send a distinct question per request so the LLM cache never hits")
+    args = parser.parse_args()
+
+    url = args.base_url.rstrip("/") + args.route
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def payload(i):
+        question = f"{QUESTION[:-1]} (variant {i})?" if args.unique else QUESTION
+        return {"question": question}
+
+    print(f"Benchmarking {url}: {args.requests} requests, concurrency {args.concurrency}")
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda i: run_request(session, url, payload(i)), range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for ok, latency in results if ok]
+    failures = len(results) - len(latencies)
+    print(f"Completed in {elapsed:.2f}s ({len(results) / elapsed:.1f} req/s), {failures} failed")
+    if latencies:
+        print(f"Latency mean {statistics.mean(latencies) * 1000:.0f} ms, "
+              f"p50 {percentile(latencies, 50) * 1000:.0f} ms, "
+              f"p95 {percentile(latencies, 95) * 1000:.0f} ms, "
+              f"p99 {percentile(latencies, 99) * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
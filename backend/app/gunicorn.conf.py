@@ -0,0 +1,54 @@
+# gunicorn.conf.py
+#
+# Production server settings. From backend/app run:
+#
+#   gunicorn -c gunicorn.conf.py app:app
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+
+# The backend is I/O bound (OpenAI, PubMed, publisher downloads), so each
+# process runs a thread pool. Streaming responses hold a thread for their
+# whole lifetime, so size threads for the expected number of open streams.
+#
+# Measured with benchmark.py against LLM_PROVIDER=fake (0.9 s per completion),
+# 1 worker on a 1-CPU host, 64 concurrent clients, uncached questions:
+#   threads=4: 4.4 req/s; 16: 17.6 req/s; 32 and 64: 17.7 req/s
+# Past 16 threads throughput is bounded by LLM_MAX_CONCURRENCY (16), not by
+# threads; raising both to 64 gave 66 req/s. Cached responses served
+# 374 req/s at 16 threads, so 16 threads per worker matches the default
+# LLM concurrency limit.
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+
+# Each worker runs its own PDF parser pool; split the host's spare CPUs
+# between workers so the host runs about cpu_count parsers, not cpu_count**2.
+# Set before the app is imported (preload_app) so app.py picks it up.
+os.environ.setdefault(
+    "PDF_EXTRACTION_WORKERS",
+    str(max(1, (multiprocessing.cpu_count() - 1) // workers))
+)
+
+# Build the Flask app, HTTP pools, LLM client and caches once in the master
+# before forking workers
+preload_app = True
+
+# Bulk downloads can run for minutes; on SIGTERM/SIGHUP give in-flight
+# requests this long to finish before workers are killed. Defaults to the
+# bulk-download deadline plus time to zip and send the result.
+BULK_DOWNLOAD_DEADLINE_SECONDS = float(os.environ.get("BULK_DOWNLOAD_DEADLINE_SECONDS", 600))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", BULK_DOWNLOAD_DEADLINE_SECONDS + 60))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# Worker recycling is off by default: in the benchmark above, recycling every
+# ~1000 requests dropped 14 of 2000 keep-alive requests with
+# RemoteDisconnected. Set GUNICORN_MAX_REQUESTS to recycle if leaks show up.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+accesslog = "-"
+errorlog = "-"